@@ -0,0 +1,219 @@
+import functools
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+import orjson
+from cachetools import TLRUCache
+
+# Persistent cache shared by every Streamlit session and surviving restarts
+CACHE_DIR = os.environ.get("GIFT_CACHE_DIR", "./.gift_cache")
+_DB_PATH = os.path.join(CACHE_DIR, "cache.sqlite3")
+
+# How often each namespace sweeps out expired entries that were never read
+# again; without it one-off URLs and requests would stay on disk forever
+PURGE_INTERVAL = 3600
+_last_purge: Dict[str, float] = {}
+_purge_lock = threading.Lock()
+
+
+# One connection per thread, opened on first use; reopening the database (and
+# re-running the schema check) on every lookup cost more than the query itself
+_local = threading.local()
+
+
+def _connect() -> sqlite3.Connection:
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        conn = sqlite3.connect(_DB_PATH, timeout=30)
+        # WAL lets every worker and Streamlit process read while another writes
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, expires_at REAL NOT NULL, "
+            "PRIMARY KEY (namespace, key))"
+        )
+        _local.conn = conn
+    return conn
+
+
+def cache_get_entry(namespace: str, key: str, grace: float = 0) -> Optional[Tuple[Any, float]]:
+    """
+    Look up a cached value along with when it expires.
+
+    Args:
+        namespace: Cache namespace (e.g. "serp", "extract")
+        key: Cache key within the namespace
+        grace: Seconds past expiry that an entry is still kept and returned (as stale)
+
+    Returns:
+        Tuple of (value, expires_at), or None on a miss or an entry expired beyond grace
+    """
+    try:
+        with _connect() as conn:
+            row = conn.execute(
+                "SELECT value, expires_at FROM cache WHERE namespace = ? AND key = ?",
+                (namespace, key)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[1] + grace < time.time():
+                conn.execute("DELETE FROM cache WHERE namespace = ? AND key = ?", (namespace, key))
+                return None
+            return orjson.loads(row[0]), row[1]
+    except (sqlite3.Error, OSError, ValueError):
+        return None
+
+
+def cache_set(namespace: str, key: str, value: Any, ttl: float, grace: float = 0) -> None:
+    """
+    Store a JSON-serializable value for ttl seconds, purging the namespace's old entries every PURGE_INTERVAL.
+
+    Args:
+        namespace: Cache namespace (e.g. "serp", "extract")
+        key: Cache key within the namespace
+        value: JSON-serializable value to store
+        ttl: Time to live in seconds
+        grace: Seconds past expiry that entries in this namespace are kept (see cache_get_entry)
+    """
+    now = time.time()
+    with _purge_lock:
+        purge = now - _last_purge.get(namespace, 0) > PURGE_INTERVAL
+        if purge:
+            _last_purge[namespace] = now
+    try:
+        with _connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                (namespace, key, orjson.dumps(value).decode(), now + ttl)
+            )
+            if purge:
+                conn.execute("DELETE FROM cache WHERE namespace = ? AND expires_at < ?", (namespace, now - grace))
+    except (sqlite3.Error, OSError, TypeError, ValueError):
+        pass
+
+
+def cached(
+    namespace: str,
+    ttl: Union[float, Callable[..., float]],
+    key: Callable[..., str],
+    should_cache: Callable[[Any], bool] = lambda result: result is not None,
+    memory_size: int = 0,
+    refresh_after: Optional[Union[float, Callable[..., float]]] = None,
+    stale_if_error: float = 0
+):
+    """
+    Memoize a function's result in the persistent cache.
+
+    Args:
+        namespace: Cache namespace for this function
+        ttl: Time to live in seconds, or a function of (result, *args, **kwargs) returning it
+        key: Builds the cache key from the function's arguments
+        should_cache: Decides whether a result is worth caching (errors are not)
+        memory_size: Entries also kept in an in-process LRU in front of SQLite (0 disables it)
+        refresh_after: Age in seconds after which a cached value is still returned but
+            recomputed in the background (stale-while-revalidate), or a function of
+            (result, *args, **kwargs) returning it; None never refreshes early
+        stale_if_error: Seconds past expiry that a value is kept on disk and served if
+            recomputing it raises (e.g. the API is down); 0 disables the fallback
+
+    Returns:
+        Decorator wrapping the function with a cache lookup
+    """
+    def decorator(func):
+        # Size-capped LRU whose entries expire with their stored (value, expires_at)
+        memory = TLRUCache(maxsize=max(memory_size, 1), ttu=lambda _key, entry, _now: entry[1], timer=time.time)
+        memory_lock = threading.Lock()
+        refreshing = set()
+        inflight: Dict[str, Future] = {}
+
+        def remember(cache_key, value, expires_at):
+            if not memory_size:
+                return
+            with memory_lock:
+                memory[cache_key] = (value, expires_at)
+
+        def ttl_of(value, args, kwargs):
+            return ttl(value, *args, **kwargs) if callable(ttl) else ttl
+
+        def refresh_after_of(value, args, kwargs):
+            return refresh_after(value, *args, **kwargs) if callable(refresh_after) else refresh_after
+
+        def store(cache_key, value, args, kwargs):
+            seconds = ttl_of(value, args, kwargs)
+            cache_set(namespace, cache_key, value, seconds, grace=stale_if_error)
+            remember(cache_key, value, time.time() + seconds)
+
+        def refresh(cache_key, args, kwargs):
+            try:
+                value = func(*args, **kwargs)
+                if should_cache(value):
+                    store(cache_key, value, args, kwargs)
+            except Exception:
+                pass  # Keep serving the stale value; the next stale hit retries
+            finally:
+                with memory_lock:
+                    refreshing.discard(cache_key)
+
+        def compute(cache_key, entry, args, kwargs):
+            try:
+                value = func(*args, **kwargs)
+            except Exception:
+                if entry is None:
+                    raise
+                return entry[0]  # Expired, but better than failing outright
+            if should_cache(value):
+                store(cache_key, value, args, kwargs)
+            return value
+
+        def lookup(cache_key):
+            if memory_size:
+                with memory_lock:
+                    entry = memory.get(cache_key)
+                if entry is not None:
+                    return entry
+            entry = cache_get_entry(namespace, cache_key, grace=stale_if_error)
+            if entry is not None and entry[1] > time.time():
+                remember(cache_key, *entry)
+            return entry
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            cache_key = key(*args, **kwargs)
+            entry = lookup(cache_key)
+            if entry is None or entry[1] <= time.time():
+                # Single flight: concurrent misses for the same key wait on one call
+                with memory_lock:
+                    future = inflight.get(cache_key)
+                    leader = future is None
+                    if leader:
+                        future = inflight[cache_key] = Future()
+                if not leader:
+                    return future.result()
+                try:
+                    value = compute(cache_key, entry, args, kwargs)
+                except BaseException as e:
+                    future.set_exception(e)
+                    raise
+                else:
+                    future.set_result(value)
+                    return value
+                finally:
+                    with memory_lock:
+                        inflight.pop(cache_key, None)
+
+            value, expires_at = entry
+            if refresh_after is not None and time.time() - (expires_at - ttl_of(value, args, kwargs)) > refresh_after_of(value, args, kwargs):
+                with memory_lock:
+                    start = cache_key not in refreshing
+                    refreshing.add(cache_key)
+                if start:
+                    threading.Thread(
+                        target=refresh, args=(cache_key, args, kwargs), name=f"{namespace}-refresh", daemon=True
+                    ).start()
+            return value
+        return wrapper
+    return decorator
@@ -0,0 +1,51 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Longest Retry-After we will wait out; a user is watching the spinner
+MAX_RETRY_AFTER = 5
+
+
+class _CappedRetry(Retry):
+    """Retry that honors Retry-After but never sleeps longer than MAX_RETRY_AFTER."""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, MAX_RETRY_AFTER)
+
+
+# One connection-pooled session shared by every outbound API call (Azure OpenAI,
+# Perplexity, SerpAPI) so TCP/TLS connections are reused across pipeline stages,
+# worker threads and button clicks instead of being re-established per request
+SESSION = requests.Session()
+
+# Retry transient failures and rate limits with jittered exponential backoff
+# (0s, 1s, 2s, plus up to 0.25s jitter), honoring Retry-After up to
+# MAX_RETRY_AFTER. Kept short because a user is waiting on every call; the
+# final response is returned as-is so callers still see the API's error details.
+# Read timeouts are never retried: the request already reached the server, and
+# re-sending an LLM POST would bill another full generation and keep the user
+# waiting for it
+_retry = _CappedRetry(
+    total=3,
+    read=0,
+    backoff_factor=0.5,
+    backoff_jitter=0.25,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=frozenset({"HEAD", "GET", "POST"}),
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+
+_adapter = HTTPAdapter(pool_connections=20, pool_maxsize=100, max_retries=_retry)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+# Separate session for fetching marketplace product pages. Those sites often
+# answer non-browser clients with 503, and retrying only delays the fallback to
+# the browser, so this session never retries
+PAGE_SESSION = requests.Session()
+
+_page_adapter = HTTPAdapter(pool_connections=20, pool_maxsize=100, max_retries=0)
+PAGE_SESSION.mount("https://", _page_adapter)
+PAGE_SESSION.mount("http://", _page_adapter)
@@ -1,11 +1,47 @@
 import asyncio
-import json
-import streamlit as st
+import atexit
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import orjson
+import requests
 from pydantic import BaseModel, Field
 from typing import List, Dict, Any, Optional
+from urllib.parse import urljoin, urlsplit, urlunsplit
+from bs4 import BeautifulSoup
 from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, CacheMode, LLMConfig
 from crawl4ai.extraction_strategy import LLMExtractionStrategy
 from crawl4ai.content_scraping_strategy import WebScrapingStrategy
+from cache import cached
+from http_session import PAGE_SESSION
+from settings import get_secret
+
+# Where Playwright's chromium is installed (baked in by setup.sh, or on first run).
+# Set once at import so every browser launch in this process finds it
+PLAYWRIGHT_BROWSERS_PATH = os.environ.setdefault("PLAYWRIGHT_BROWSERS_PATH", "/tmp/playwright")
+
+# Prices and availability drift, so extracted metadata is only reused for a day
+EXTRACT_CACHE_TTL = 24 * 3600
+
+# Statuses that mean the page is definitely gone. Other 4xx/5xx are not trusted:
+# marketplaces often reject HEAD requests or non-browser clients outright
+DEAD_LINK_STATUSES = {404, 410}
+
+# Pages crawled at once by the shared browser (~150 MB each, so bound by memory)
+EXTRACT_CONCURRENCY = int(os.getenv("EXTRACT_CONCURRENCY", 4))
+
+# Layout and script tags stripped before the page is turned into markdown for the LLM
+EXCLUDED_TAGS = ["nav", "footer", "header", "script", "style", "form", "noscript"]
+
+# Storefronts that render the product client-side; plain HTTP fetches of these
+# come back as an empty app shell, so they always go straight to the browser
+JS_HEAVY_DOMAINS = ("myntra.com", "ajio.com", "nykaa.com", "tatacliq.com")
+
+# Server-rendered pages with less text than this are treated as a shell or bot wall
+MIN_FAST_PATH_WORDS = 150
+
+_UA = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 
 class Product(BaseModel):
     # Basic Product Info
@@ -53,12 +89,168 @@ class Product(BaseModel):
     bride_groom_to_be: bool = Field(default=False, description="Suited for Bride/Groom to be")
 
 
+# The schema never changes, so generate it once rather than on every extraction
+_PRODUCT_SCHEMA = Product.model_json_schema()
+
+# Same instruction on every extraction
+_EXTRACTION_INSTRUCTION = """Extract comprehensive product information from this product page and analyze it to fill ALL fields:
+
+BASIC INFO: Extract product name, brand, detailed description, specifications, key selling points, price (always should be in INR), website, delivery info.
+
+PRODUCT DESCRIPTION: Extract the product description as it isfrom the page.
+
+EVERYTHING YOU NEED TO KNOW: Specific details about the products as it is from the page.
+
+IMAGE LINKS: Extract ONLY product-related image URLs from the page. Focus on main product images, product gallery images, product zoom images, and product variant images. EXCLUDE logos, banners, ads, navigation icons, or any non-product images. Include only full URLs of images that show the actual product being sold.
+
+DEMOGRAPHICS: Determine target gender, age range (if for kids), price bracket (Budget/Mid-range/Premium/Luxury), and available cities.
+
+STYLE & OCCASIONS: Identify suitable occasions, style tags, and target personas.
+
+BOOLEAN OCCASIONS: Analyze if product is suitable for:
+- Valentine's Day, Baby Shower, Anniversaries & Weddings, Birthdays, House Warmings, Festivals
+
+BOOLEAN PERSONALITIES: Determine if product suits these personality types:
+- Fitness/Sports Enthusiast, Aesthete, Minimalist/Functional, Maximalist, Fashionable, Foodie, Wellness Seeker, New Parent, Teenagers, Working Professionals, Parents, Bride/Groom to be
+
+Be analytical and thoughtful about the boolean fields - consider the product type, style, and use case.
+Return only ONE comprehensive product object."""
+
+
+# Browser config with cloud-optimized settings, shared by every crawler
+_BROWSER_CFG = BrowserConfig(
+    headless=True,
+    browser_type="chromium",
+    user_agent=_UA
+)
+
+
+# One browser for the whole process, driven by an event loop on a background
+# thread; every extraction opens a page in it instead of launching chromium
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+_crawler_task: Optional[asyncio.Task] = None
+_crawler_lock = asyncio.Lock()
+_extract_semaphore = asyncio.Semaphore(EXTRACT_CONCURRENCY)
+
+# The same bound for the no-browser path, which runs on the callers' worker threads
+_fast_semaphore = threading.BoundedSemaphore(EXTRACT_CONCURRENCY)
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="crawl4ai-loop", daemon=True).start()
+        return _loop
+
+
+async def _start_crawler() -> AsyncWebCrawler:
+    crawler = AsyncWebCrawler(config=_BROWSER_CFG)
+    await crawler.start()
+    return crawler
+
+
+async def _get_crawler() -> AsyncWebCrawler:
+    """Start the shared crawler once; concurrent callers await the same startup."""
+    global _crawler_task
+    if _crawler_task is None:
+        _crawler_task = asyncio.ensure_future(_start_crawler())
+    try:
+        return await _crawler_task
+    except Exception:
+        _crawler_task = None  # Let the next extraction retry the browser launch
+        raise
+
+
+# Error text Playwright/crawl4ai produce once chromium has crashed or been killed.
+# A single page or context closing produces some of the same text, so a match is
+# only a hint to check whether the browser itself is still connected
+BROWSER_GONE_MARKERS = (
+    "has been closed",
+    "browser has disconnected",
+    "connection closed",
+    "target closed",
+)
+
+
+def _browser_gone(error: str) -> bool:
+    error = error.lower()
+    return any(marker in error for marker in BROWSER_GONE_MARKERS)
+
+
+def _browser_connected(crawler: AsyncWebCrawler) -> bool:
+    browser_manager = getattr(crawler.crawler_strategy, "browser_manager", None)
+    browser = getattr(browser_manager, "browser", None)
+    return browser is not None and browser.is_connected()
+
+
+async def _reset_crawler(crawler: AsyncWebCrawler) -> None:
+    """Drop a dead shared crawler so the next extraction launches a fresh browser."""
+    global _crawler_task
+    async with _crawler_lock:
+        # Another extraction that hit the same crash may already have reset it
+        task = _crawler_task
+        if task is None or not task.done() or task.cancelled() or task.exception() is not None:
+            return
+        if task.result() is not crawler:
+            return
+        # Only a closed page or context; other extractions are still using this browser
+        if _browser_connected(crawler):
+            return
+        _crawler_task = None
+        try:
+            await crawler.close()
+        except Exception:
+            pass
+
+
+def warm_up_crawler() -> None:
+    """Start launching the shared browser in the background so the first extraction doesn't wait for it."""
+    asyncio.run_coroutine_threadsafe(_get_crawler(), _get_loop())
+
+
+@atexit.register
+def _close_crawler() -> None:
+    if _loop is None or _crawler_task is None or not _crawler_task.done():
+        return
+    try:
+        asyncio.run_coroutine_threadsafe(_crawler_task.result().close(), _loop).result(timeout=10)
+    except BaseException:
+        pass
+
+
+@functools.lru_cache(maxsize=8)
+def _llm_strategy(azure_provider: str, api_token: str, base_url: str) -> LLMExtractionStrategy:
+    """Extraction strategy for one set of LLM credentials, built once and reused across crawls."""
+    # Configure LLM
+    llm_config = LLMConfig(
+        provider=azure_provider,
+        api_token=api_token,
+        base_url=base_url
+    )
+    
+    return LLMExtractionStrategy(
+        llm_config=llm_config,
+        schema=_PRODUCT_SCHEMA,
+        extraction_type="schema",
+        instruction=_EXTRACTION_INSTRUCTION,
+        chunk_token_threshold=3000,
+        overlap_rate=0.1,
+        apply_chunking=False,
+        input_format="markdown",
+        extra_args={"temperature": 0.0, "max_tokens": 2000}
+    )
+
+
 async def extract_product_data(
     url: str,
     azure_provider: str = "azure/gpt-4o",
     api_token: str = "",
     base_url: str = "",
-    show_usage: bool = False
+    show_usage: bool = False,
+    crawler: Optional[AsyncWebCrawler] = None
 ) -> Dict[str, Any]:
     """
     Extract comprehensive product data from a product page URL.
@@ -69,105 +261,71 @@ async def extract_product_data(
         api_token: Azure OpenAI API token
         base_url: Azure OpenAI base URL
         show_usage: Whether to show token usage stats
+        crawler: Already started crawler to reuse; a new browser is launched if omitted
         
     Returns:
         Dict containing extracted product data or error information
     """
     try:
-        import os
-        
-        # Set environment variables for Streamlit Cloud
-        os.environ['PLAYWRIGHT_BROWSERS_PATH'] = '/tmp/playwright'
-        
-        # Configure LLM
-        llm_config = LLMConfig(
-            provider=azure_provider,
-            api_token=api_token,
-            base_url=base_url
-        )
-        
-        llm_strategy = LLMExtractionStrategy(
-            llm_config=llm_config,
-            schema=Product.model_json_schema(),
-            extraction_type="schema",
-            instruction="""Extract comprehensive product information from this product page and analyze it to fill ALL fields:
-
-            BASIC INFO: Extract product name, brand, detailed description, specifications, key selling points, price (always should be in INR), website, delivery info.
-
-            PRODUCT DESCRIPTION: Extract the product description as it isfrom the page.
-
-            EVERYTHING YOU NEED TO KNOW: Specific details about the products as it is from the page.
-            
-            IMAGE LINKS: Extract ONLY product-related image URLs from the page. Focus on main product images, product gallery images, product zoom images, and product variant images. EXCLUDE logos, banners, ads, navigation icons, or any non-product images. Include only full URLs of images that show the actual product being sold.
-            
-            DEMOGRAPHICS: Determine target gender, age range (if for kids), price bracket (Budget/Mid-range/Premium/Luxury), and available cities.
-            
-            STYLE & OCCASIONS: Identify suitable occasions, style tags, and target personas.
-            
-            BOOLEAN OCCASIONS: Analyze if product is suitable for:
-            - Valentine's Day, Baby Shower, Anniversaries & Weddings, Birthdays, House Warmings, Festivals
-            
-            BOOLEAN PERSONALITIES: Determine if product suits these personality types:
-            - Fitness/Sports Enthusiast, Aesthete, Minimalist/Functional, Maximalist, Fashionable, Foodie, Wellness Seeker, New Parent, Teenagers, Working Professionals, Parents, Bride/Groom to be
-            
-            Be analytical and thoughtful about the boolean fields - consider the product type, style, and use case.
-            Return only ONE comprehensive product object.""",
-            chunk_token_threshold=3000,
-            overlap_rate=0.1,
-            apply_chunking=False,
-            input_format="markdown",
-            extra_args={"temperature": 0.0, "max_tokens": 2000}
-        )
+        llm_strategy = _llm_strategy(azure_provider, api_token, base_url)
 
         # Build crawler config with Streamlit Cloud optimizations
         crawl_config = CrawlerRunConfig(
             extraction_strategy=llm_strategy,
             cache_mode=CacheMode.BYPASS,
-            word_count_threshold=20000,  # ~80k tokens (4 chars per token, ~5 chars per word)
-            only_text=True,  # Extract only text content
+            word_count_threshold=20000,  # Minimum words for a text block to be kept
+            excluded_tags=EXCLUDED_TAGS,  # Page chrome that never describes the product
+            exclude_external_links=True,  # Drop off-site links from the markdown sent to the LLM
+            only_text=False,  # Keep image markdown so image_links can be extracted
             remove_overlay_elements=True,  # Remove popups, ads, etc.
             magic=False,  # Disable smart content extraction
             page_timeout=45000,  # Reduced timeout for cloud environment
             delay_before_return_html=1.0  # Reduced delay
         )
 
-        # Create browser config with cloud-optimized settings
-        browser_cfg = BrowserConfig(
-            headless=True,
-            browser_type="chromium",
-            user_agent="Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        )
-
-        async with AsyncWebCrawler(config=browser_cfg) as crawler:
+        if crawler is None:
+            async with AsyncWebCrawler(config=_BROWSER_CFG) as own_crawler:
+                result = await own_crawler.arun(url=url, config=crawl_config)
+        else:
             result = await crawler.arun(url=url, config=crawl_config)
 
-            if result.success:
-                data = json.loads(result.extracted_content)
-                
-                # Handle case where data is a list (take first item) or dict
-                if isinstance(data, list):
-                    if len(data) > 0:
-                        product_data = data[0]
-                    else:
-                        return {"success": False, "error": "No products found in extracted data"}
+        if result.success:
+            data = orjson.loads(result.extracted_content)
+            
+            # Handle case where data is a list (take first item) or dict
+            if isinstance(data, list):
+                if len(data) > 0:
+                    product_data = data[0]
                 else:
-                    product_data = data
-
-                if show_usage:
-                    llm_strategy.show_usage()
-
-                return {
-                    "success": True,
-                    "data": product_data,
-                    "url": url
-                }
+                    return {"success": False, "error": "No products found in extracted data"}
             else:
+                product_data = data
+
+            # A failed LLM call (rate limit, timeout) comes back as an error block
+            # while the crawl itself still reports success
+            if not isinstance(product_data, dict) or product_data.get("error"):
+                content = product_data.get("content") if isinstance(product_data, dict) else product_data
                 return {
                     "success": False,
-                    "error": f"Crawling failed: {result.error_message}",
+                    "error": f"LLM extraction failed: {content}",
                     "url": url
                 }
-                
+
+            if show_usage:
+                llm_strategy.show_usage()
+
+            return {
+                "success": True,
+                "data": product_data,
+                "url": url
+            }
+        else:
+            return {
+                "success": False,
+                "error": f"Crawling failed: {result.error_message}",
+                "url": url
+            }
+            
     except ImportError as e:
         return {
             "success": False,
@@ -182,6 +340,193 @@ async def extract_product_data(
         }
 
 
+async def extract_product_data_batch(
+    urls: List[str],
+    azure_provider: str = "azure/gpt-4o",
+    api_token: str = "",
+    base_url: str = "",
+    concurrency: int = EXTRACT_CONCURRENCY
+) -> List[Dict[str, Any]]:
+    """
+    Extract product data for several URLs with one browser, for use outside the app's shared loop.
+    
+    Args:
+        urls: Product page URLs to crawl
+        azure_provider: Azure provider format (e.g., "azure/gpt-4o")
+        api_token: Azure OpenAI API token
+        base_url: Azure OpenAI base URL
+        concurrency: Maximum pages crawled at once
+        
+    Returns:
+        Results in the same order as urls, each a dict as from extract_product_data
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with AsyncWebCrawler(config=_BROWSER_CFG) as crawler:
+        async def one(url: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await extract_product_data(url, azure_provider, api_token, base_url, crawler=crawler)
+
+        results = await asyncio.gather(*(one(url) for url in urls), return_exceptions=True)
+
+    return [
+        result if not isinstance(result, BaseException)
+        else {"success": False, "error": f"Extraction error: {str(result)}", "url": url}
+        for url, result in zip(urls, results)
+    ]
+
+
+async def extract_product_async(
+    url: str,
+    azure_provider: str = "azure/gpt-4o",
+    api_token: str = "",
+    base_url: str = "",
+    show_usage: bool = False
+) -> Dict[str, Any]:
+    """
+    Extract product data using the shared browser, at most EXTRACT_CONCURRENCY pages at a time.
+    Must run on the shared crawler loop (see extract_product_sync).
+    
+    Args:
+        url: Product page URL to crawl
+        azure_provider: Azure provider format (e.g., "azure/gpt-4o")
+        api_token: Azure OpenAI API token
+        base_url: Azure OpenAI base URL
+        show_usage: Whether to show token usage stats
+        
+    Returns:
+        Dict containing extracted product data or error information
+    """
+    async with _extract_semaphore:
+        try:
+            crawler = await _get_crawler()
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"Browser startup failed: {str(e)}",
+                "url": url
+            }
+        result = await extract_product_data(url, azure_provider, api_token, base_url, show_usage, crawler=crawler)
+        if not result.get("success") and _browser_gone(result.get("error", "")):
+            # Resets only if chromium itself has disconnected
+            await _reset_crawler(crawler)
+        return result
+
+
+def _is_js_heavy(url: str) -> bool:
+    host = urlsplit(url).hostname or ""
+    return any(host == domain or host.endswith("." + domain) for domain in JS_HEAVY_DOMAINS)
+
+
+def _html_to_markdown(html: str, url: str) -> str:
+    """Page text with images kept as markdown, minus the tags the browser path excludes."""
+    soup = BeautifulSoup(html, "lxml")
+    for tag in soup(EXCLUDED_TAGS):
+        tag.decompose()
+    for img in soup.find_all("img"):
+        src = img.get("src") or img.get("data-src")
+        img.replace_with(f"![{img.get('alt', '')}]({urljoin(url, src)})" if src else "")
+    return (soup.body or soup).get_text("\n", strip=True)
+
+
+def extract_product_fast(
+    url: str,
+    azure_provider: str = "azure/gpt-4o",
+    api_token: str = "",
+    base_url: str = ""
+) -> Optional[Dict[str, Any]]:
+    """
+    Extract product data from server-rendered HTML without launching the browser.
+    
+    Args:
+        url: Product page URL to fetch
+        azure_provider: Azure provider format (e.g., "azure/gpt-4o")
+        api_token: Azure OpenAI API token
+        base_url: Azure OpenAI base URL
+        
+    Returns:
+        Dict containing extracted product data or error information, or None if the
+        page needs the browser. An LLM failure is returned as an error rather than
+        None, since retrying it in the browser would only call the LLM again
+    """
+    if _is_js_heavy(url):
+        return None
+    with _fast_semaphore:
+        try:
+            response = PAGE_SESSION.get(url, headers={"User-Agent": _UA}, timeout=10)
+            if response.status_code in DEAD_LINK_STATUSES:
+                return _unavailable(url, response.status_code)
+            if not response.ok or "html" not in response.headers.get("Content-Type", ""):
+                return None
+            markdown = _html_to_markdown(response.text, url)
+        except Exception:
+            return None
+        if len(markdown.split()) < MIN_FAST_PATH_WORDS:
+            return None
+
+        try:
+            data = _llm_strategy(azure_provider, api_token, base_url).run(url, [markdown])
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"LLM extraction failed: {str(e)}",
+                "url": url
+            }
+
+    # Same list/dict handling as the browser path; LLM failures come back as error blocks
+    product_data = data[0] if isinstance(data, list) and data else data
+    if not isinstance(product_data, dict) or not product_data or product_data.get("error"):
+        content = product_data.get("content") if isinstance(product_data, dict) else product_data
+        return {
+            "success": False,
+            "error": f"LLM extraction failed: {content}",
+            "url": url
+        }
+    return {
+        "success": True,
+        "data": product_data,
+        "url": url
+    }
+
+
+def _unavailable(url: str, status_code: int) -> Dict[str, Any]:
+    return {
+        "success": False,
+        "error": f"Product page unavailable (HTTP {status_code})",
+        "url": url
+    }
+
+
+def preflight_status(url: str) -> Optional[int]:
+    """
+    Cheap HEAD request to find dead links before spending a browser page on them.
+    
+    Args:
+        url: Product page URL
+        
+    Returns:
+        HTTP status code, or None if the check itself failed
+    """
+    try:
+        # Browser UA, since marketplaces throttle the default python-requests one
+        return PAGE_SESSION.head(url, headers={"User-Agent": _UA}, timeout=3, allow_redirects=True).status_code
+    except requests.exceptions.RequestException:
+        return None
+
+
+def _canonical_url(url: str, *args, **kwargs) -> str:
+    """Cache key for a product page: the URL without query string or fragment."""
+    parts = urlsplit(url.strip())
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, "", ""))
+
+
+def _should_cache_extraction(result: Dict[str, Any]) -> bool:
+    """Only successful extractions are cached; an error block must never be served for a day."""
+    data = result.get("data")
+    return bool(result.get("success")) and isinstance(data, dict) and not data.get("error")
+
+
+@cached("extract", EXTRACT_CACHE_TTL, key=_canonical_url, should_cache=_should_cache_extraction)
 def extract_product_sync(
     url: str,
     azure_provider: str = "azure/gpt-4o",
@@ -190,7 +535,7 @@ def extract_product_sync(
     show_usage: bool = False
 ) -> Dict[str, Any]:
     """
-    Synchronous wrapper for extract_product_data.
+    Synchronous wrapper for extract_product_async, safe to call from any thread.
     
     Args:
         url: Product page URL to crawl
@@ -202,23 +547,65 @@ def extract_product_sync(
     Returns:
         Dict containing extracted product data or error information
     """
-    return asyncio.run(extract_product_data(url, azure_provider, api_token, base_url, show_usage))
+    # Most marketplaces render product pages on the server; only use a browser page when needed.
+    # The fast path's own GET already reports dead links
+    result = extract_product_fast(url, azure_provider, api_token, base_url)
+    if result is not None:
+        return result
+
+    # JS-heavy storefronts skip the fast path, so check for a dead link before spending a browser page
+    if _is_js_heavy(url):
+        status_code = preflight_status(url)
+        if status_code in DEAD_LINK_STATUSES:
+            return _unavailable(url, status_code)
+
+    future = asyncio.run_coroutine_threadsafe(
+        extract_product_async(url, azure_provider, api_token, base_url, show_usage),
+        _get_loop()
+    )
+    return future.result()
+
+
+def extract_products_sync(
+    urls: List[str],
+    azure_provider: str = "azure/gpt-4o",
+    api_token: str = "",
+    base_url: str = ""
+) -> List[Dict[str, Any]]:
+    """
+    Extract product data for several URLs concurrently on the shared browser.
+    
+    Args:
+        urls: Product page URLs to crawl
+        azure_provider: Azure provider format (e.g., "azure/gpt-4o")
+        api_token: Azure OpenAI API token
+        base_url: Azure OpenAI base URL
+        
+    Returns:
+        Results in the same order as urls, each a dict as from extract_product_sync
+    """
+    extract = functools.partial(
+        extract_product_sync, azure_provider=azure_provider, api_token=api_token, base_url=base_url
+    )
+    with ThreadPoolExecutor(max_workers=EXTRACT_CONCURRENCY, thread_name_prefix="extract") as executor:
+        return list(executor.map(extract, urls))
 
 
 async def main():
     """Example usage - only runs when script is executed directly"""
     # Example configuration
-    url = "https://www.amazon.in/JBL-Bluetooth-Dustproof-PartyBoost-Personalization/dp/B09V7WS4PP?th=1"
+    urls = ["https://www.amazon.in/JBL-Bluetooth-Dustproof-PartyBoost-Personalization/dp/B09V7WS4PP?th=1"]
     azure_provider = "azure/gpt-4o"
-    api_token = st.secrets["api_keys"]["azure_openai"]
-    base_url = st.secrets["azure_openai"]["endpoint"]
+    api_token = get_secret("api_keys", "azure_openai", "AZURE_OPENAI_API_KEY")
+    base_url = get_secret("azure_openai", "endpoint", "AZURE_OPENAI_ENDPOINT")
     
-    result = await extract_product_data(url, azure_provider, api_token, base_url, show_usage=True)
+    results = await extract_product_data_batch(urls, azure_provider, api_token, base_url)
     
-    if result["success"]:
-        print(json.dumps(result["data"], indent=2, ensure_ascii=False))
-    else:
-        print(f"Error: {result['error']}")
+    for result in results:
+        if result["success"]:
+            print(orjson.dumps(result["data"], option=orjson.OPT_INDENT_2).decode())
+        else:
+            print(f"Error: {result['error']}")
 
 
 if __name__ == "__main__":
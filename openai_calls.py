@@ -1,49 +1,41 @@
-import json
+import hashlib
+import re
+import orjson
 import requests
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 import streamlit as st
-from datetime import datetime
+from cache import cached
+from http_session import SESSION
+from settings import azure_chat_url, get_secret
 
-def parse_gift_request(user_input: str) -> Dict[str, Any]:
-    """
-    Parse a natural language gift request using Azure OpenAI to extract structured information
-    
-    Args:
-        user_input: Free-form text describing the gift need
-        api_key: Azure OpenAI API key
-        
-    Returns:
-        Dictionary with structured gift request information
-    """
-    
-    # Azure OpenAI configuration from secrets
-    azure_endpoint = st.secrets["azure_openai"]["endpoint"]
-    deployment_name = st.secrets["azure_openai"]["deployment_name"]
-    api_version = st.secrets["azure_openai"]["api_version"]
-    api_key = st.secrets["api_keys"]["azure_openai"]
+# Parsing runs at temperature 0, so a repeated gift request parses the same way
+PARSE_CACHE_TTL = 7 * 24 * 3600
 
-    today = datetime.now().strftime("%Y-%m-%d")
-    
-    # Construct the parsing prompt
-    prompt = f"""
-Analyze this gift request and extract structured information, with special focus on personalizing categories based on interests:
+# Currency symbol, thousands separators and whitespace dropped from LLM prices in one pass
+_PRICE_STRIP_TBL = str.maketrans('', '', '₹, \t\n')
 
-USER REQUEST: {user_input}
+# Perplexity is asked to end its answer with the product list as a fenced JSON block
+_JSON_FENCE = re.compile(r"```json\s*(.*?)```", re.S)
+
+# Static instructions go in the system message and per-request data in a short
+# user message after it, so every call shares the same prompt prefix and the
+# provider's prompt caching can reuse it
+PARSE_SYSTEM_PROMPT = """Analyze the user's gift request and extract structured information, with special focus on personalizing categories based on interests:
 
 Extract and return the following information in JSON format:
 
-{{
-    "recipient": {{
+{
+    "recipient": {
         "gender": "Inferred gender if clear from context, otherwise unisex",
         "age_group": "Age group if mentioned or can be inferred (child, teen, adult, senior)",
         "relationship": "Relationship to gift giver",
         "interests": "List of interests or hobbies mentioned or implied, including subtle preferences that can be inferred from the request, if not mentioned keep it as N/A"
-    }},
+    },
     "occasion": "The gift occasion (birthday, anniversary, etc.)",
-    "budget": {{
+    "budget": {
         "min": "Minimum budget in INR (75% of  if not specified)",
         "max": "Maximum budget in INR from context"
-    }},
+    },
     "search_queries": [
         "2-3 search-ready queries for gift discovery based on the context"
     ],
@@ -57,7 +49,7 @@ Extract and return the following information in JSON format:
         "- Considerate of how they might use or experience the gift",
         "- Should be within the budget range"
     ]
-}}
+}
 
 IMPORTANT:
 - All monetary values should be in INR
@@ -110,8 +102,106 @@ Note: If the query is too specific, generate 1 category.
 Return ONLY the JSON object, no additional text.
 """
 
-    # Azure OpenAI API call
-    url = f"{azure_endpoint}/openai/deployments/{deployment_name}/chat/completions?api-version={api_version}"
+# Structured-output schema for parse_gift_request; the model's decoding is
+# constrained to it, so the reply is always complete, valid JSON of this shape.
+# Needs a deployment that supports structured outputs (gpt-4o 2024-08-06 or
+# later, API version 2024-08-01-preview or later); older deployments reject it
+# with HTTP 400 and the call falls back to PARSE_FALLBACK_RESPONSE_FORMAT
+PARSE_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "gift_request",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "recipient": {
+                    "type": "object",
+                    "properties": {
+                        "gender": {"type": "string"},
+                        "age_group": {"type": "string"},
+                        "relationship": {"type": "string"},
+                        "interests": {"type": "array", "items": {"type": "string"}}
+                    },
+                    "required": ["gender", "age_group", "relationship", "interests"],
+                    "additionalProperties": False
+                },
+                "occasion": {"type": "string"},
+                "budget": {
+                    "type": "object",
+                    "properties": {
+                        "min": {"type": "number"},
+                        "max": {"type": "number"}
+                    },
+                    "required": ["min", "max"],
+                    "additionalProperties": False
+                },
+                "search_queries": {"type": "array", "items": {"type": "string"}},
+                "gift_categories": {"type": "array", "items": {"type": "string"}}
+            },
+            "required": ["recipient", "occasion", "budget", "search_queries", "gift_categories"],
+            "additionalProperties": False
+        }
+    }
+}
+
+# Plain JSON mode for deployments without structured-output support
+PARSE_FALLBACK_RESPONSE_FORMAT = {"type": "json_object"}
+
+FORMAT_SYSTEM_PROMPT = """Take the product recommendations from Perplexity given by the user and format them into a structured JSON format:
+
+Please format this into the following JSON structure:
+
+{
+    "product_ideas": [
+        {
+            "name": "EXACT product name with brand and model",
+            "category": "Product category",
+            "estimated_price_range": {
+                "min": number,
+                "max": number
+            },
+            "why_recommended": "Brief explanation of fit",
+            "search_keywords": [
+                "Exact search terms to find this specific product"
+            ]
+        }
+    ]
+}
+
+IMPORTANT:
+- Extract the exact product names mentioned in the Perplexity response
+- Price values must be numbers only (no currency symbols or commas)
+- If price ranges are mentioned, extract min and max values
+- Create appropriate search keywords for each product
+- Ensure all products are properly categorized
+
+Return ONLY the JSON object, no additional text.
+"""
+
+
+def _request_key(user_input: str) -> str:
+    """Cache key for a gift request, ignoring case and surrounding whitespace."""
+    return hashlib.blake2b(user_input.strip().lower().encode(), digest_size=16).hexdigest()
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+@cached("parse", PARSE_CACHE_TTL, key=_request_key, should_cache=lambda result: "error" not in result)
+def parse_gift_request(user_input: str) -> Dict[str, Any]:
+    """
+    Parse a natural language gift request using Azure OpenAI to extract structured information
+    
+    Args:
+        user_input: Free-form text describing the gift need
+        api_key: Azure OpenAI API key
+        
+    Returns:
+        Dictionary with structured gift request information
+    """
+    
+    # Azure OpenAI configuration, read from secrets once per process
+    api_key = get_secret("api_keys", "azure_openai", "AZURE_OPENAI_API_KEY")
+    url = azure_chat_url()
     
     headers = {
         "Content-Type": "application/json",
@@ -120,33 +210,42 @@ Return ONLY the JSON object, no additional text.
     
     payload = {
         "messages": [
+            {
+                "role": "system",
+                "content": PARSE_SYSTEM_PROMPT
+            },
             {
                 "role": "user",
-                "content": prompt
+                "content": f"USER REQUEST: {user_input}"
             }
         ],
         "temperature": 0,
         "max_tokens": 1000,
-        "response_format": { "type": "json_object" }
+        "response_format": PARSE_RESPONSE_FORMAT
     }
     
     try:
         # Make the API request
-        response = requests.post(url, headers=headers, json=payload)
+        response = SESSION.post(url, headers=headers, json=payload, timeout=(5, 60))
+
+        # Older deployments reject json_schema; retry once in plain JSON mode
+        if response.status_code == 400 and "response_format" in response.text:
+            payload["response_format"] = PARSE_FALLBACK_RESPONSE_FORMAT
+            response = SESSION.post(url, headers=headers, json=payload, timeout=(5, 60))
         response.raise_for_status()
         
         # Parse response
-        response_data = response.json()
+        response_data = orjson.loads(response.content)
         
         if 'choices' in response_data and len(response_data['choices']) > 0:
             content = response_data['choices'][0]['message']['content']
             
             # Parse the JSON response
             try:
-                parsed_data = json.loads(content.strip())
+                parsed_data = orjson.loads(content)
                 return parsed_data
                 
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 return {
                     "error": f"Failed to parse Azure OpenAI response: {str(e)}",
                     "raw_content": content,
@@ -170,6 +269,60 @@ Return ONLY the JSON object, no additional text.
         return {"error": f"Unexpected error: {str(e)}"}
 
 
+def _to_int_price(value: Any) -> int:
+    """Convert an LLM price such as 2499, "2,499" or "₹2,499.00" to whole rupees."""
+    if isinstance(value, (int, float)):
+        return int(value)
+    return int(float(str(value).translate(_PRICE_STRIP_TBL)))
+
+
+def _clean_price(price_range: Dict[str, Any]) -> Dict[str, int]:
+    """Numeric min/max for an estimated price range; both 0 if either can't be read."""
+    try:
+        return {"min": _to_int_price(price_range.get("min", 0)), "max": _to_int_price(price_range.get("max", 0))}
+    except (ValueError, TypeError):
+        return {"min": 0, "max": 0}
+
+
+def _clean_product_ideas(product_ideas: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Product ideas with numeric price ranges, rebuilt in one pass."""
+    return [
+        {**product, "estimated_price_range": _clean_price(product.get("estimated_price_range") or {})}
+        for product in product_ideas
+    ]
+
+
+def _parse_fenced_ideas(perplexity_response: str) -> Optional[Dict[str, Any]]:
+    """
+    Read the product list from the last ```json block in Perplexity's answer.
+    
+    Args:
+        perplexity_response: Raw response from Perplexity API
+        
+    Returns:
+        Structured product recommendations, or None if no usable block was found
+    """
+    for block in reversed(_JSON_FENCE.findall(perplexity_response)):
+        try:
+            parsed_data = orjson.loads(block)
+        except orjson.JSONDecodeError:
+            continue
+        if not isinstance(parsed_data, dict):
+            continue
+        product_ideas = parsed_data.get("product_ideas")
+        if not isinstance(product_ideas, list) or not product_ideas:
+            continue
+        # Anything off-shape goes to the Azure formatter rather than crashing the cleanup
+        if all(
+            isinstance(product, dict) and isinstance(product.get("estimated_price_range") or {}, dict)
+            for product in product_ideas
+        ):
+            return parsed_data
+        return None
+    return None
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
 def format_perplexity_output(perplexity_response: str) -> Dict[str, Any]:
     """
     Format Perplexity's raw response into structured JSON using Azure OpenAI
@@ -180,50 +333,15 @@ def format_perplexity_output(perplexity_response: str) -> Dict[str, Any]:
     Returns:
         Structured product recommendations
     """
+    # Use the JSON block Perplexity was asked to include; only call Azure when it is missing or malformed
+    parsed_data = _parse_fenced_ideas(perplexity_response)
+    if parsed_data is not None:
+        parsed_data["product_ideas"] = _clean_product_ideas(parsed_data["product_ideas"])
+        return parsed_data
     
-    # Azure OpenAI configuration from secrets
-    azure_endpoint = st.secrets["azure_openai"]["endpoint"]
-    deployment_name = st.secrets["azure_openai"]["deployment_name"]
-    api_version = st.secrets["azure_openai"]["api_version"]
-    api_key = st.secrets["api_keys"]["azure_openai"]
-    
-    format_prompt = f"""
-Take the following product recommendations from Perplexity and format them into a structured JSON format:
-
-PERPLEXITY RESPONSE:
-{perplexity_response}
-
-Please format this into the following JSON structure:
-
-{{
-    "product_ideas": [
-        {{
-            "name": "EXACT product name with brand and model",
-            "category": "Product category",
-            "estimated_price_range": {{
-                "min": number,
-                "max": number
-            }},
-            "why_recommended": "Brief explanation of fit",
-            "search_keywords": [
-                "Exact search terms to find this specific product"
-            ]
-        }}
-    ]
-}}
-
-IMPORTANT:
-- Extract the exact product names mentioned in the Perplexity response
-- Price values must be numbers only (no currency symbols or commas)
-- If price ranges are mentioned, extract min and max values
-- Create appropriate search keywords for each product
-- Ensure all products are properly categorized
-
-Return ONLY the JSON object, no additional text.
-"""
-
-    # Azure OpenAI API call
-    url = f"{azure_endpoint}/openai/deployments/{deployment_name}/chat/completions?api-version={api_version}"
+    # Azure OpenAI configuration, read from secrets once per process
+    api_key = get_secret("api_keys", "azure_openai", "AZURE_OPENAI_API_KEY")
+    url = azure_chat_url()
     
     headers = {
         "Content-Type": "application/json",
@@ -232,9 +350,13 @@ Return ONLY the JSON object, no additional text.
     
     payload = {
         "messages": [
+            {
+                "role": "system",
+                "content": FORMAT_SYSTEM_PROMPT
+            },
             {
                 "role": "user",
-                "content": format_prompt
+                "content": f"PERPLEXITY RESPONSE:\n{perplexity_response}"
             }
         ],
         "temperature": 0.1,
@@ -244,35 +366,26 @@ Return ONLY the JSON object, no additional text.
     
     try:
         # Make the API request
-        response = requests.post(url, headers=headers, json=payload)
+        response = SESSION.post(url, headers=headers, json=payload, timeout=(5, 60))
         response.raise_for_status()
         
         # Parse response
-        response_data = response.json()
+        response_data = orjson.loads(response.content)
         
         if 'choices' in response_data and len(response_data['choices']) > 0:
             content = response_data['choices'][0]['message']['content']
             
             # Parse the JSON response
             try:
-                parsed_data = json.loads(content.strip())
+                parsed_data = orjson.loads(content)
                 
-                # Validate and clean up the response
+                # Validate and clean up the response: price range values must be numbers
                 if "product_ideas" in parsed_data:
-                    for product in parsed_data["product_ideas"]:
-                        # Ensure price range values are numbers
-                        price_range = product.get("estimated_price_range", {})
-                        try:
-                            price_range["min"] = int(float(str(price_range.get("min", 0)).replace('₹', '').replace(',', '').strip()))
-                            price_range["max"] = int(float(str(price_range.get("max", 0)).replace('₹', '').replace(',', '').strip()))
-                        except (ValueError, TypeError):
-                            price_range["min"] = 0
-                            price_range["max"] = 0
-                        product["estimated_price_range"] = price_range
+                    parsed_data["product_ideas"] = _clean_product_ideas(parsed_data["product_ideas"])
                 
                 return parsed_data
                 
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 return {
                     "error": f"Failed to parse Azure OpenAI response: {str(e)}",
                     "raw_content": content,
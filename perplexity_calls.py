@@ -1,32 +1,20 @@
+import hashlib
 import requests
 import json
 from typing import Dict, Any
+import orjson
 import streamlit as st
+from cache import cached
+from http_session import SESSION
+from settings import get_secret
 
-def generate_product_ideas(user_request: str, parsed_request: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Generate specific product ideas using Perplexity API based on parsed gift request
-    
-    Args:
-        user_request: Original user request
-        parsed_request: Structured gift request information
-        
-    Returns:
-        Dictionary with product recommendations
-    """
-    perplexity_api_key = st.secrets["api_keys"]["perplexity"]
+# Recommendations for the same brief stay relevant for about a week
+IDEAS_CACHE_TTL = 7 * 24 * 3600
 
-    # Extract relevant information from parsed request
-    recipient = parsed_request.get('recipient', {})
-    interests = parsed_request.get('interests', [])
-    occasion = parsed_request.get('occasion', 'Not specified')
-    budget = parsed_request.get('budget', {})
-    categories = parsed_request.get('gift_categories', [])
-    # Format interests string
-    interests_str = ', '.join(interests) if interests else "No specific interests mentioned"
-    
-    # System prompt - defines the role and capabilities
-    system_prompt = """You are an expert product research assistant specializing in gift recommendations for the Indian market. Your role is to research and recommend specific, currently available products that can be purchased online in India.
+# System prompt - defines the role and capabilities. It is identical on every call
+# and sent first, so the provider can serve it from its prompt cache; everything
+# request-specific goes in the user message
+SYSTEM_PROMPT = """You are an expert product research assistant specializing in gift recommendations for the Indian market. Your role is to research and recommend specific, currently available products that can be purchased online in India.
 
 CAPABILITIES:
 - Research real products available in Indian e-commerce platforms
@@ -69,7 +57,80 @@ OUTPUT FORMAT:
 - Provide detailed explanations for each recommendation
 - Include estimated price ranges based on current market data
 - Explain why each product fits the recipient's profile
-- Highlight quality aspects and customer satisfaction"""
+- Highlight quality aspects and customer satisfaction
+
+After the recommendations, end with a ```json fenced block listing every recommended product in this exact structure (prices as plain numbers in INR, no currency symbols or commas):
+```json
+{
+    "product_ideas": [
+        {
+            "name": "EXACT product name with brand and model",
+            "category": "Product category",
+            "estimated_price_range": {"min": 0, "max": 0},
+            "why_recommended": "Brief explanation of fit",
+            "search_keywords": ["Exact search terms to find this specific product"]
+        }
+    ]
+}
+```"""
+
+
+def _ideas_key(user_request: str, parsed_request: Dict[str, Any]) -> str:
+    """Cache key for a normalized request plus its parsed fields."""
+    digest = hashlib.blake2b(user_request.strip().lower().encode(), digest_size=16)
+    digest.update(orjson.dumps(parsed_request, option=orjson.OPT_SORT_KEYS))
+    return digest.hexdigest()
+
+
+def _read_stream(response: requests.Response) -> str:
+    """
+    Assemble the message content from a server-sent event stream of chat completion chunks.
+    
+    Args:
+        response: Streaming response from the chat completions endpoint
+        
+    Returns:
+        Concatenated content of all chunks (empty if none carried any)
+    """
+    parts = []
+    for line in response.iter_lines():
+        if not line.startswith(b"data:"):
+            continue
+        data = line[5:].strip()
+        if data == b"[DONE]":
+            break
+        choices = orjson.loads(data).get("choices")
+        if choices:
+            parts.append(choices[0].get("delta", {}).get("content") or "")
+    return "".join(parts)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+@cached("ideas", IDEAS_CACHE_TTL, key=_ideas_key, should_cache=lambda result: isinstance(result, str))
+def generate_product_ideas(user_request: str, parsed_request: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Generate specific product ideas using Perplexity API based on parsed gift request
+    
+    Args:
+        user_request: Original user request
+        parsed_request: Structured gift request information
+        
+    Returns:
+        Dictionary with product recommendations
+    """
+    perplexity_api_key = get_secret("api_keys", "perplexity", "PERPLEXITY_API_KEY")
+
+    # Extract relevant information from parsed request
+    recipient = parsed_request.get('recipient', {})
+    # Interests are parsed under the recipient
+    interests = recipient.get('interests') or parsed_request.get('interests') or []
+    if isinstance(interests, str):
+        interests = [interests]
+    occasion = parsed_request.get('occasion', 'Not specified')
+    budget = parsed_request.get('budget', {})
+    categories = parsed_request.get('gift_categories', [])
+    # Format interests string
+    interests_str = ', '.join(interests) if interests else "No specific interests mentioned"
 
     # User prompt - specific request with context
     user_prompt = f"""ORIGINAL REQUEST: {user_request}
@@ -105,7 +166,7 @@ Explore mutliple brands and categories to give a diverse set of recommendations.
         "messages": [
             {
                 "role": "system",
-                "content": system_prompt
+                "content": SYSTEM_PROMPT
             },
             {
                 "role": "user",
@@ -113,21 +174,20 @@ Explore mutliple brands and categories to give a diverse set of recommendations.
             }
         ],
         "temperature": 0.7,
-        "max_tokens": 4000
+        "max_tokens": 4000,
+        "stream": True
     }
     
     try:
-        # Disable SSL verification and suppress warnings
-        requests.packages.urllib3.disable_warnings(requests.packages.urllib3.exceptions.InsecureRequestWarning)
+        # Stream the answer so tokens arrive as they are generated; the 30 s
+        # timeout then bounds the gap between chunks, not the whole generation
+        with SESSION.post(url, headers=headers, json=payload, timeout=(5, 30), stream=True) as response:
+            if not response.ok:
+                response.content  # Buffer the error body so it can still be reported once the stream closes
+            response.raise_for_status()
+            content = _read_stream(response)
         
-        response = requests.post(url, headers=headers, json=payload, verify=False, timeout=30)
-        response.raise_for_status()
-        
-        response_data = response.json()
-        
-        if 'choices' in response_data and len(response_data['choices']) > 0:
-            content = response_data['choices'][0]['message']['content']
-            
+        if content:
             return content
                 
         else:
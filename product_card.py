@@ -0,0 +1,205 @@
+import base64
+from html import escape
+from typing import Any, Dict, List, Tuple
+from jinja2 import BaseLoader, Environment
+
+# Inline "No Image" placeholder so missing images never hit a third-party host
+PLACEHOLDER_IMAGE = "data:image/svg+xml;base64," + base64.b64encode(
+    b'<svg xmlns="http://www.w3.org/2000/svg" width="200" height="200">'
+    b'<rect width="200" height="200" fill="#eee"/>'
+    b'<text x="100" y="100" text-anchor="middle" dominant-baseline="middle" '
+    b'font-family="sans-serif" font-size="16" fill="#999">No Image</text>'
+    b'</svg>'
+).decode()
+
+# Whole product card (header, image, name, brand/price, link, description) as one
+# HTML block, so each product costs a single st.markdown delta
+CARD_HTML = """
+<div style="
+    height: 2px;
+    background: #dee2e6;
+    margin: 30px 0;
+    border-radius: 1px;
+"></div>
+<div style="
+    background: #2E86AB;
+    padding: 20px;
+    border-radius: 12px;
+    margin: 20px 0;
+    box-shadow: 0 4px 16px rgba(46, 134, 171, 0.2);
+">
+    <h2 style="color: white; margin: 0; font-size: 24px;">🎁 Gift Option #{{ i + 1 }}</h2>
+</div>
+{% set metadata = product.get("metadata") %}
+<div style="display: flex; gap: 24px; align-items: flex-start;">
+    <div style="flex: 1; text-align: center;">
+        {% if metadata and metadata.get("image_links") %}
+        <img src="{{ metadata["image_links"][0] }}" width="200" alt="Product image">
+        <div style="color: #6c757d; font-size: 14px;">📸 Product Image</div>
+        {% else %}
+        <img src="{{ placeholder }}" width="200" alt="No image">
+        {% endif %}
+    </div>
+    <div style="flex: 2;">
+        <h3 style="
+            color: #2E86AB;
+            font-size: 28px;
+            margin: 0 0 15px 0;
+            font-weight: bold;
+        ">🏷️ {{ product.get("name", "Unknown Product") }}</h3>
+        {% if metadata %}
+        {% set price = metadata.get("price", "Price not available") %}
+        <div style="display: flex; gap: 16px;">
+            <div style="
+                flex: 1;
+                background: #f8f9fa;
+                padding: 10px;
+                border-radius: 8px;
+                border-left: 4px solid #2E86AB;
+            ">
+                <strong style="color: #2E86AB;">🏢 Brand:</strong><br>
+                <span style="font-size: 18px; color: #495057;">{{ metadata.get("brand", "Unknown Brand") }}</span>
+            </div>
+            <div style="
+                flex: 1;
+                background: #f8f9fa;
+                padding: 10px;
+                border-radius: 8px;
+                border-left: 4px solid #6c757d;
+            ">
+                <strong style="color: #6c757d;">💰 Price:</strong><br>
+                <span style="font-size: 18px; color: #495057; font-weight: bold;">{{ price if price == "Price not available" else "₹" ~ price }}</span>
+            </div>
+        </div>
+        {% endif %}
+        <br>
+        {% if product.get("link") %}
+        <a href="{{ product["link"] }}" target="_blank" style="
+            background: #2E86AB;
+            color: white;
+            padding: 12px 24px;
+            text-decoration: none;
+            border-radius: 8px;
+            font-weight: bold;
+            display: inline-block;
+            margin: 10px 0;
+            box-shadow: 0 2px 8px rgba(46, 134, 171, 0.3);
+            transition: all 0.2s;
+        " onmouseover="this.style.background='#1f5f7a'; this.style.transform='translateY(-2px)'" onmouseout="this.style.background='#2E86AB'; this.style.transform='translateY(0)'">
+            🛒 View Product
+        </a>
+        {% endif %}
+        {% if metadata %}
+        {% if metadata.get("success") is false or metadata.get("error") %}
+        <div style="
+            background: #fff3cd;
+            padding: 15px;
+            border-radius: 8px;
+            margin: 15px 0;
+            border-left: 4px solid #ffc107;
+        ">
+            <strong style="color: #856404;">⚠️ Error:</strong><br>
+            <span style="color: #856404; line-height: 1.6;">{{ metadata.get("error", "Unknown error occurred during extraction") }}</span>
+        </div>
+        {% elif metadata.get("product_description") %}
+        <div style="
+            background: #f8f9fa;
+            padding: 15px;
+            border-radius: 8px;
+            margin: 15px 0;
+            border-left: 4px solid #2E86AB;
+        ">
+            <strong style="color: #2E86AB;">📝 Description:</strong><br>
+            <span style="color: #495057; line-height: 1.6;">{{ metadata["product_description"] }}</span>
+        </div>
+        {% endif %}
+        {% else %}
+        <div style="
+            background: #f8d7da;
+            padding: 15px;
+            border-radius: 8px;
+            margin: 15px 0;
+            border-left: 4px solid #dc3545;
+        ">
+            <strong style="color: #721c24;">❌ Error:</strong><br>
+            <span style="color: #721c24; line-height: 1.6;">No product information could be extracted</span>
+        </div>
+        {% endif %}
+    </div>
+</div>
+"""
+
+# Compiled once at import; autoescape keeps scraped text from injecting markup
+CARD_TEMPLATE = Environment(
+    loader=BaseLoader(),
+    autoescape=True,
+    trim_blocks=True,
+    lstrip_blocks=True
+).from_string(CARD_HTML)
+
+
+def render_card(product: Dict[str, Any], i: int) -> str:
+    """
+    Render a product card as a single HTML string for st.markdown.
+
+    Args:
+        product: Product dict with "name", "link" and "metadata"
+        i: Zero-based position of the product in the results
+
+    Returns:
+        HTML for the card
+    """
+    html = CARD_TEMPLATE.render(product=product, i=i, placeholder=PLACEHOLDER_IMAGE)
+    # A blank line would end the HTML block in Markdown, so drop them
+    return "\n".join(line for line in html.splitlines() if line.strip())
+
+
+# Styles for the yes/no suitability chips and the image gallery; emitted once per page
+DETAILS_CSS = """
+<style>
+.chip-grid { display: grid; column-gap: 16px; }
+.chip { background: #f8f9fa; color: #6c757d; padding: 8px; border-radius: 8px; margin: 5px 0; border-left: 3px solid #dee2e6; }
+.chip.on { background: #e8f4f8; color: #2E86AB; border-left-color: #2E86AB; }
+.gallery { display: grid; grid-template-columns: repeat(3, 1fr); gap: 16px; }
+.gallery figure { margin: 0; }
+.gallery figcaption { color: #6c757d; font-size: 14px; }
+</style>
+"""
+
+
+def render_chip_grid(items: List[Tuple[str, bool]], columns: int) -> str:
+    """
+    Render yes/no suitability flags as one HTML grid.
+
+    Args:
+        items: (label, value) pairs
+        columns: Number of grid columns
+
+    Returns:
+        HTML for the grid
+    """
+    chips = "".join(
+        f'<div class="chip {"on" if value else "off"}">'
+        f'<strong>{escape(title)}:</strong><br><span>{"✅ Yes" if value else "⚪ No"}</span>'
+        f'</div>'
+        for title, value in items
+    )
+    return f'<div class="chip-grid" style="grid-template-columns: repeat({columns}, 1fr);">{chips}</div>'
+
+
+def render_gallery(image_links: List[str]) -> str:
+    """
+    Render product images as one lazily loaded HTML grid.
+
+    Args:
+        image_links: Image URLs
+
+    Returns:
+        HTML for the gallery
+    """
+    figures = "".join(
+        f'<figure><img src="{escape(url)}" width="150" loading="lazy" alt="Image {n}">'
+        f'<figcaption>📷 Image {n}</figcaption></figure>'
+        for n, url in enumerate(image_links, start=1)
+    )
+    return f'<div class="gallery">{figures}</div>'
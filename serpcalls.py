@@ -1,33 +1,122 @@
-import requests
-import json
-import streamlit as st
+import hashlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import List, Optional
+import orjson
+from cache import cached
+from http_session import SESSION
+from settings import get_secret
 
+# Product links rarely change, so a week-old lookup is still good; after a day
+# (or half its TTL, if shorter) it is served as-is while a background search
+# refreshes it, so the refresh always starts before the entry expires
+SERP_CACHE_TTL = 7 * 24 * 3600
+SERP_REFRESH_AFTER = 24 * 3600
+
+# Queries with no results are remembered briefly so they don't re-bill SerpAPI
+# on every retry, but not long enough to hide a product that gets listed later
+SERP_NEGATIVE_TTL = 3600
+
+# Names without a model number ("wireless speaker for trekking") match whichever
+# listing ranks today, so their links are kept for a day instead of a week
+SERP_GENERIC_TTL = 24 * 3600
+
+# Expired links are kept this much longer and served if SerpAPI is unreachable
+SERP_STALE_IF_ERROR = 30 * 24 * 3600
+
+# In-flight SerpAPI requests across all sessions, kept under the account's rate limit
+SERP_CONCURRENCY = int(os.getenv("SERP_CONCURRENCY", 5))
+_serp_semaphore = threading.BoundedSemaphore(SERP_CONCURRENCY)
+
+# Search settings shared by every query (read-only; the key and query are added per call)
+SERP_PARAMS = MappingProxyType({
+    "engine": "google",
+    "location": "India",
+    "google_domain": "google.co.in",
+    "gl": "in",
+    "hl": "en",
+    "num": 1,  # Limit to 1 result
+    "json_restrictor": "organic_results[].{link}"  # Only the fields we read, not the whole results page
+})
+
+
+# Hot queries are also kept in memory, so popular gifts skip even the SQLite lookup
+SERP_MEMORY_SIZE = 4096
+
+
+def _normalize_query(query):
+    return " ".join(query.lower().split())
+
+
+def _query_key(query):
+    return hashlib.blake2b(_normalize_query(query).encode()).hexdigest()
+
+
+def _link_ttl(link, query):
+    if not link:
+        return SERP_NEGATIVE_TTL
+    return SERP_CACHE_TTL if any(char.isdigit() for char in query) else SERP_GENERIC_TTL
+
+
+def _link_refresh_after(link, query):
+    return min(SERP_REFRESH_AFTER, _link_ttl(link, query) / 2)
+
+
+@cached(
+    "serp",
+    _link_ttl,
+    key=_query_key,
+    should_cache=lambda link: True,
+    memory_size=SERP_MEMORY_SIZE,
+    refresh_after=_link_refresh_after,
+    stale_if_error=SERP_STALE_IF_ERROR
+)
 def get_product_links(query):
-    params = {
-        "api_key": st.secrets["api_keys"]["serp_api"],
-        "engine": "google",
-        "q": query,
-        "location": "India",
-        "google_domain": "google.co.in",
-        "gl": "in",
-        "hl": "en",
-        "num": 1  # Limit to 1 result
-    }
-
-    # Disable SSL verification
-    response = requests.get("https://serpapi.com/search.json", params=params, verify=False)
-    # Suppress the warning about insecure requests
-    requests.packages.urllib3.disable_warnings(requests.packages.urllib3.exceptions.InsecureRequestWarning)
-
-    data = response.json()
+    params = {**SERP_PARAMS, "api_key": get_secret("api_keys", "serp_api", "SERP_API_KEY"), "q": _normalize_query(query)}
+
+    with _serp_semaphore:
+        response = SESSION.get("https://serpapi.com/search.json", params=params, timeout=(5, 15))
+    # Failed calls raise rather than return None, so they are never cached as "no results"
+    response.raise_for_status()
+
+    data = orjson.loads(response.content)
 
     if data.get("organic_results"):
         return data["organic_results"][0]["link"]
     else:
         return None
 
+
+def get_product_links_batch(queries: List[str]) -> List[Optional[str]]:
+    """
+    Look up product links for several queries concurrently, searching each distinct query once.
+    
+    Args:
+        queries: Product names to search for
+        
+    Returns:
+        Links in the same order as queries (None where nothing was found)
+    """
+    unique = list(dict.fromkeys(_normalize_query(query) for query in queries))
+    if not unique:
+        return []
+    with ThreadPoolExecutor(max_workers=min(SERP_CONCURRENCY, len(unique)), thread_name_prefix="serp") as executor:
+        links = dict(zip(unique, executor.map(get_product_links, unique)))
+    return [links[_normalize_query(query)] for query in queries]
+
+
 if __name__ == "__main__":
-    results = get_product_links("JBL Flip 6 speakers")
-    print(json.dumps(results, indent=4))
-    with open('search_results_full.json', 'w', encoding='utf-8') as f:
-        json.dump(results, indent=4, fp=f)
\ No newline at end of file
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Look up product links for one or more queries.")
+    parser.add_argument("queries", nargs="*", default=["JBL Flip 6 speakers"], help="Product names to search for")
+    parser.add_argument("--output", default="search_results_full.json", help="File to write the results to")
+    args = parser.parse_args()
+
+    results = dict(zip(args.queries, get_product_links_batch(args.queries)))
+    output = orjson.dumps(results, option=orjson.OPT_INDENT_2).decode()
+    print(output)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        f.write(output)
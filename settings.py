@@ -0,0 +1,31 @@
+import functools
+import os
+import streamlit as st
+
+
+@functools.cache
+def get_secret(section: str, key: str, env_var: str) -> str:
+    """
+    Read a secret once per process from Streamlit secrets, falling back to an environment variable.
+
+    Args:
+        section: Section of secrets.toml (e.g. "api_keys")
+        key: Key within the section
+        env_var: Environment variable used when secrets.toml is missing or lacks the key (CLI runs)
+
+    Returns:
+        The secret value, or an empty string if neither source has it
+    """
+    try:
+        return st.secrets[section][key]
+    except Exception:
+        return os.environ.get(env_var, "")
+
+
+@functools.cache
+def azure_chat_url() -> str:
+    """Chat completions URL for the configured Azure OpenAI deployment."""
+    endpoint = get_secret("azure_openai", "endpoint", "AZURE_OPENAI_ENDPOINT")
+    deployment_name = get_secret("azure_openai", "deployment_name", "AZURE_OPENAI_DEPLOYMENT")
+    api_version = get_secret("azure_openai", "api_version", "AZURE_OPENAI_API_VERSION")
+    return f"{endpoint}/openai/deployments/{deployment_name}/chat/completions?api-version={api_version}"
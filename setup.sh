@@ -0,0 +1,7 @@
+#!/usr/bin/env bash
+# Build-time setup: bake the Playwright chromium build into the image so the
+# app does not download it on the first request.
+set -euo pipefail
+
+pip install -r requirements.txt
+PLAYWRIGHT_BROWSERS_PATH=/tmp/playwright python -m playwright install --with-deps chromium
@@ -1,15 +1,19 @@
-import requests
-import json
-import streamlit as st
+import asyncio
+import logging
+import httpx
+import orjson
+from settings import get_secret
 
-def test_perplexity_connection():
+log = logging.getLogger(__name__)
+
+async def check_perplexity_connection():
     """
-    Simple test to verify Perplexity API connection
+    Simple async check of the Perplexity API connection, usable from an event loop
     """
     try:
         # Get API key from secrets
-        perplexity_api_key = st.secrets["api_keys"]["perplexity"]
-        print(f"API Key loaded: {perplexity_api_key[:10]}...")
+        perplexity_api_key = get_secret("api_keys", "perplexity", "PERPLEXITY_API_KEY")
+        log.debug("API Key loaded: %s...", perplexity_api_key[:10])
         
         # Simple test prompt
         test_prompt = "What is the capital of India?"
@@ -34,27 +38,35 @@ def test_perplexity_connection():
             "max_tokens": 100
         }
         
-        print("Making API request...")
-        response = requests.post(url, headers=headers, json=payload)
+        log.debug("Making API request...")
+        # HTTP/2 and compressed responses keep the long JSON answer small on the wire
+        async with httpx.AsyncClient(http2=True, timeout=httpx.Timeout(30, connect=5)) as client:
+            response = await client.post(url, headers={**headers, "Accept-Encoding": "gzip, br"}, json=payload)
         
-        print(f"Status Code: {response.status_code}")
-        print(f"Response Headers: {dict(response.headers)}")
+        log.debug("Status Code: %s", response.status_code)
+        log.debug("Response Headers: %s", response.headers)
         
         if response.status_code == 200:
-            response_data = response.json()
-            print("\n✅ SUCCESS!")
-            print(f"Response: {json.dumps(response_data, indent=2)}")
+            response_data = orjson.loads(response.content)
+            log.info("✅ SUCCESS!")
+            log.debug("Response: %s", response_data)
             
             if 'choices' in response_data and len(response_data['choices']) > 0:
                 content = response_data['choices'][0]['message']['content']
-                print(f"\n📝 Answer: {content}")
+                log.info("📝 Answer: %s", content)
             
         else:
-            print(f"\n❌ FAILED!")
-            print(f"Error: {response.text}")
+            log.error("❌ FAILED! Status %s: %s", response.status_code, response.text)
             
     except Exception as e:
-        print(f"\n💥 EXCEPTION: {str(e)}")
+        log.exception("💥 EXCEPTION: %s", e)
+
+def test_perplexity_connection():
+    """
+    Simple test to verify Perplexity API connection
+    """
+    asyncio.run(check_perplexity_connection())
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     test_perplexity_connection() 
\ No newline at end of file